@@ -16,9 +16,37 @@ UPDATED: August 28, 2025
 """
 
 from __future__ import print_function  # Python 2/3 compatibility for print function
+import os
 import sys
+from contextlib import contextmanager
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om
+
+
+@contextmanager
+def viewport_suspended(pause_ogs=False):
+    """Suspend viewport refresh and group undo while running bulk scene operations"""
+    # Nested try/finally so every step that succeeded is undone, even if a later one raises
+    cmds.undoInfo(openChunk=True)
+    try:
+        cmds.refresh(suspend=True)
+        try:
+            # ogs -pause is a toggle, so only flip it when we are the ones pausing
+            ogs_paused = False
+            try:
+                if pause_ogs and not cmds.ogs(query=True, pause=True):
+                    cmds.ogs(pause=True)
+                    ogs_paused = True
+                yield
+            finally:
+                if ogs_paused:
+                    cmds.ogs(pause=True)
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.refresh(force=True)
+    finally:
+        cmds.undoInfo(closeChunk=True)
 
 
 class DDFreeSplitTool:
@@ -32,7 +60,19 @@ class DDFreeSplitTool:
         self.projection_curves = []  # List for multiple curves
         self.pfx_stroke = None
         self.original_camera_state = {}
+        self._ortho_width = None  # orthographicWidth set by setup_orthographic_camera
         self.gui_window = None
+        self._window_alive = False  # Flipped by a uiDeleted scriptJob when the window closes
+        self._created_nodes = set()  # Every node the tool creates, deleted on cleanup
+        self._curve_var_groups = []  # curveVarGroups returned by polyProjectCurve, kept until cleanup
+        
+        # Projection and split settings - used directly in batch mode, mirrored by the UI otherwise
+        self.curve_samples = 50
+        self.projection_tolerance = 0.001
+        self.points_on_edges = False
+        self.automatic_projection = True
+        self.keep_projected_curves = False
+        self.detach_edges = True
         
         # Detect Python and Maya version for compatibility
         self.python_version = sys.version_info[0]
@@ -40,15 +80,27 @@ class DDFreeSplitTool:
             self.maya_version = int(cmds.about(version=True))
         except:
             self.maya_version = 2026  # Default assumption
+        try:
+            self.batch_mode = cmds.about(batch=True)
+        except:
+            self.batch_mode = False
+        
+        # Resolve the defaultPaint preset once instead of probing install paths on every activation
+        maya_location = os.environ.get("MAYA_LOCATION", "")
+        self._paint_mel = os.path.join(maya_location, "Examples", "Paint_Effects",
+                                       "Airbrush", "defaultPaint.mel").replace("\\", "/")
+        self._paint_mel_exists = bool(maya_location) and os.path.isfile(self._paint_mel)
         
     def resize_window_on_collapse(self, *args):
         """Resize window to fit content when projection settings are collapsed"""
-        if self.gui_window and cmds.window(self.gui_window, exists=True):
-            # Force window to shrink by temporarily disabling resizeToFitChildren
-            cmds.window(self.gui_window, edit=True, resizeToFitChildren=False)
-            # Set a smaller height to force shrinking, then re-enable auto-resize
-            cmds.window(self.gui_window, edit=True, height=400)
+        if self._window_alive:
+            # Force window to shrink: smaller height with resizeToFitChildren disabled, then re-enable auto-resize
+            cmds.window(self.gui_window, edit=True, resizeToFitChildren=False, height=400)
             cmds.window(self.gui_window, edit=True, resizeToFitChildren=True)
+            
+    def _on_window_closed(self, *args):
+        """Called by the uiDeleted scriptJob once the tool window is gone"""
+        self._window_alive = False
         
     def create_ui(self):
         """Create production-ready UI"""
@@ -60,6 +112,8 @@ class DDFreeSplitTool:
                                     widthHeight=(297, 610),
                                     resizeToFitChildren=True,
                                     sizeable=True)
+        self._window_alive = True
+        cmds.scriptJob(uiDeleted=[self.gui_window, self._on_window_closed])
         
         # Force window size (Maya sometimes ignores widthHeight on fixed windows)
         #cmds.window(self.gui_window, edit=True, widthHeight=(297, 610))
@@ -110,14 +164,14 @@ class DDFreeSplitTool:
         cmds.columnLayout(adjustableColumn=True)
         cmds.rowLayout(numberOfColumns=2, columnWidth2=(120, 180))
         cmds.text(label="Curve Samples:")
-        cmds.intField("curveSamples", value=50, minValue=10, maxValue=200)
+        cmds.intField("curveSamples", value=self.curve_samples, minValue=10, maxValue=200)
         cmds.setParent('..')
         cmds.rowLayout(numberOfColumns=2, columnWidth2=(120, 180))
         cmds.text(label="Tolerance:")
-        cmds.floatField("projTolerance", value=0.001, minValue=0.0001, maxValue=0.1, precision=4)
+        cmds.floatField("projTolerance", value=self.projection_tolerance, minValue=0.0001, maxValue=0.1, precision=4)
         cmds.setParent('..')
-        cmds.checkBox("pointsOnEdges", label="Points on Edges", value=False)
-        cmds.checkBox("automatic", label="Automatic Projection", value=True)
+        cmds.checkBox("pointsOnEdges", label="Points on Edges", value=self.points_on_edges)
+        cmds.checkBox("automatic", label="Automatic Projection", value=self.automatic_projection)
         cmds.setParent('..')
         cmds.setParent('..')
         
@@ -128,8 +182,8 @@ class DDFreeSplitTool:
         cmds.frameLayout(label="Step 4: Execute Split", collapsable=False, backgroundColor=[0.2, 0.2, 0.2])
         cmds.columnLayout(adjustableColumn=True)
         cmds.button(label="Execute Split", command=self.execute_split, height=40, backgroundColor=[0.2, 0.5, 0.5])
-        cmds.checkBox("keepHistory", label="Keep Projected Curves", value=False)
-        cmds.checkBox("detachEdges", label="Detach Edges (Separate Pieces)", value=True)
+        cmds.checkBox("keepHistory", label="Keep Projected Curves", value=self.keep_projected_curves)
+        cmds.checkBox("detachEdges", label="Detach Edges (Separate Pieces)", value=self.detach_edges)
         cmds.setParent('..')
         cmds.setParent('..')
         
@@ -160,14 +214,16 @@ class DDFreeSplitTool:
         # Duplicate geometry and hide original
         self.duplicated_geo = cmds.duplicate(self.target_geo, 
                                            name=self.target_geo + "_split")[0]
+        self._created_nodes.add(self.duplicated_geo)
         cmds.hide(self.target_geo)
         
         # Update status
-        try:
-            cmds.text("status_text", edit=True, 
-                     label="Status: {} ready for splitting".format(self.target_geo))
-        except:
-            pass
+        if not self.batch_mode:
+            try:
+                cmds.text("status_text", edit=True, 
+                         label="Status: {} ready for splitting".format(self.target_geo))
+            except:
+                pass
         
     def activate_paint_tool(self, *args):
         """Activate paint tool with complete setup"""
@@ -199,8 +255,9 @@ class DDFreeSplitTool:
         }
         
         # Calculate width from bbox
-        bbox = cmds.exactWorldBoundingBox(self.target_geo)
+        bbox = self._world_bounding_box(self.target_geo)
         width = max(bbox[3] - bbox[0], bbox[4] - bbox[1], bbox[5] - bbox[2]) * 1.5
+        self._ortho_width = width
         
         # Switch to orthographic
         cmds.setAttr(camera_shape + ".orthographic", 1)
@@ -210,11 +267,38 @@ class DDFreeSplitTool:
         cmds.tumbleCtx("tumbleContext", edit=True, orthoLock=False)
         cmds.tumbleCtx("tumbleContext", edit=True, autoOrthoConstrain=False)
         
+    def _world_bounding_box(self, geo):
+        """World-space bbox [xmin, ymin, zmin, xmax, ymax, zmax] without re-evaluating the mesh"""
+        # All meshes under geo, including child transforms, so grouped input is measured in full
+        shapes = cmds.listRelatives(geo, allDescendents=True, type="mesh",
+                                    noIntermediate=True, fullPath=True) or []
+        deformed = [shape for shape in shapes
+                    if cmds.listConnections(shape + ".inMesh", source=True, destination=False)]
+        if not deformed:
+            # Clean history - the transform's cached bbox is valid
+            return cmds.xform(geo, query=True, boundingBox=True, worldSpace=True)
+            
+        # Deformed mesh - use the shapes' cached bounding boxes through the API
+        selection = om.MSelectionList()
+        for shape in shapes:
+            selection.add(shape)
+        world_bbox = None
+        for i in range(selection.length()):
+            dag_path = selection.getDagPath(i)
+            shape_bbox = om.MFnDagNode(dag_path).boundingBox
+            shape_bbox.transformUsing(dag_path.inclusiveMatrix())
+            if world_bbox is None:
+                world_bbox = shape_bbox
+            else:
+                world_bbox.expand(shape_bbox)
+        return [world_bbox.min.x, world_bbox.min.y, world_bbox.min.z,
+                world_bbox.max.x, world_bbox.max.y, world_bbox.max.z]
+        
     def create_temporary_plane(self):
         """Create temporary plane exactly as specified"""
         camera = self.original_camera_state["camera"]
         camera_shape = self.original_camera_state["camera_shape"]
-        ortho_width = cmds.getAttr(camera_shape + ".orthographicWidth")
+        ortho_width = self._ortho_width if self._ortho_width else cmds.getAttr(camera_shape + ".orthographicWidth")
         
         # Create polyPlane with exact parameters
         plane_result = cmds.polyPlane(width=ortho_width, height=ortho_width, 
@@ -222,23 +306,20 @@ class DDFreeSplitTool:
                                     axis=(0, 1, 0), createUVs=2, 
                                     constructionHistory=True,
                                     name="ddSplit_tempPlane")
-        self.temp_plane = plane_result[0]
         plane_creation_node = plane_result[1]
         
+        # Parent under the camera (the returned name is the one valid after reparenting)
+        self.temp_plane = cmds.parent(plane_result[0], camera)[0]
+        self._created_nodes.add(self.temp_plane)
+        
         # Connect camera orthographicWidth to plane dimensions
         cmds.connectAttr(camera_shape + ".orthographicWidth", 
                         plane_creation_node + ".width", force=True)
         cmds.connectAttr(camera_shape + ".orthographicWidth", 
                         plane_creation_node + ".height", force=True)
         
-        # Parent and position
-        cmds.parent(self.temp_plane, camera)
-        cmds.setAttr(self.temp_plane + ".translateX", 0)
-        cmds.setAttr(self.temp_plane + ".translateY", 0)
-        cmds.setAttr(self.temp_plane + ".translateZ", -100)
-        cmds.setAttr(self.temp_plane + ".rotateX", 90)
-        cmds.setAttr(self.temp_plane + ".rotateY", 0)
-        cmds.setAttr(self.temp_plane + ".rotateZ", 0)
+        # Position in front of the camera with a single transform edit
+        cmds.xform(self.temp_plane, translation=(0, 0, -100), rotation=(90, 0, 0))
         
         # Set to bounding box display and hide
         cmds.setAttr(self.temp_plane + ".overrideEnabled", 1)
@@ -247,20 +328,12 @@ class DDFreeSplitTool:
         
     def activate_paint_effects(self):
         """Activate Paint Effects with defaultPaint"""
-        # Load defaultPaint preset - use version-agnostic path approach
-        try:
-            # Try Maya 2026+ path first
-            mel.eval('source "C:/Program Files/Autodesk/Maya2026/Examples/Paint_Effects/Airbrush/defaultPaint.mel"')
-        except:
+        # Load defaultPaint preset from the path resolved at construction
+        if self._paint_mel_exists:
             try:
-                # Try Maya 2022 path
-                mel.eval('source "C:/Program Files/Autodesk/Maya2022/Examples/Paint_Effects/Airbrush/defaultPaint.mel"')
-            except:
-                try:
-                    # Use generic approach if specific paths fail
-                    mel.eval('source `getenv("MAYA_LOCATION")` + "/Examples/Paint_Effects/Airbrush/defaultPaint.mel"')
-                except:
-                    pass  # Silently use default paint settings
+                mel.eval('source "{}"'.format(self._paint_mel))
+            except RuntimeError:
+                pass  # Silently use default paint settings
         
         # Set wire mode (correct flag is 'dam' not 'disableAfterModifier')
         try:
@@ -298,66 +371,53 @@ class DDFreeSplitTool:
             return
             
         # Store all created projection curves for cleanup
+        # (curveVarGroups accumulate across runs so cleanup removes every one of them)
         self.projection_curves = []
         
-        # Process each stroke
-        for i, stroke_shape in enumerate(strokes):
-            # Verify stroke shape exists
-            if not stroke_shape or not cmds.objExists(stroke_shape):
-                cmds.warning("Paint Effects stroke {} is invalid - skipping!".format(i+1))
-                continue
-            
-            # Get the transform node for reference
-            stroke_transforms = cmds.listRelatives(stroke_shape, parent=True)
-            if stroke_transforms:
-                pfx_stroke = stroke_transforms[0]
-            else:
-                pfx_stroke = stroke_shape
-                
-            # Create circle for this stroke
-            circle_result = cmds.circle(center=(0, 0, 0), normal=(0, 1, 0), 
-                                      sweep=360, radius=1, degree=3, 
-                                      useTolerance=False, tolerance=0.01, 
-                                      sections=8, constructionHistory=False,
-                                      name="projCurve_{:02d}".format(i+1))
-            projection_curve = circle_result[0]
-            circle_shape = cmds.listRelatives(projection_curve, shapes=True)[0]
-            
-            # Store for cleanup
-            self.projection_curves.append(projection_curve)
-            
-            # Connect PFX stroke shape directly
-            cmds.connectAttr("{}.outMainCurves[0]".format(stroke_shape), 
-                            "{}.create".format(circle_shape), force=True)
+        # Get projection settings from UI (stored settings in batch mode)
+        curve_samples = self.curve_samples
+        tolerance = self.projection_tolerance
+        points_on_edges = self.points_on_edges
+        automatic = self.automatic_projection
         
-        # Set the first curve as main reference (for backward compatibility)
-        if self.projection_curves:
-            self.projection_curve = self.projection_curves[0]
+        if not self.batch_mode:
+            try:
+                curve_samples = cmds.intField("curveSamples", query=True, value=True)
+                tolerance = cmds.floatField("projTolerance", query=True, value=True)
+                points_on_edges = cmds.checkBox("pointsOnEdges", query=True, value=True)
+                automatic = cmds.checkBox("automatic", query=True, value=True)
+            except:
+                pass  # Use default projection settings
         
-        # Project all curves using direct Maya commands with proper settings
-        if self.projection_curves:
+        with viewport_suspended(pause_ogs=not self.batch_mode):
             try:
-                # Get projection settings from UI
-                curve_samples = 50
-                tolerance = 0.001
-                points_on_edges = False
-                automatic = True
+                # Convert and project each stroke in a single pass
+                for i, stroke_shape in enumerate(strokes):
+                    # Verify stroke shape exists
+                    if not stroke_shape or not cmds.objExists(stroke_shape):
+                        cmds.warning("Paint Effects stroke {} is invalid - skipping!".format(i+1))
+                        continue
                 
-                try:
-                    curve_samples = cmds.intField("curveSamples", query=True, value=True)
-                    tolerance = cmds.floatField("projTolerance", query=True, value=True)
-                    points_on_edges = cmds.checkBox("pointsOnEdges", query=True, value=True)
-                    automatic = cmds.checkBox("automatic", query=True, value=True)
-                except:
-                    pass  # Use default projection settings
+                    # Create circle for this stroke
+                    circle_result = cmds.circle(center=(0, 0, 0), normal=(0, 1, 0), 
+                                              sweep=360, radius=1, degree=3, 
+                                              useTolerance=False, tolerance=0.01, 
+                                              sections=8, constructionHistory=False,
+                                              name="projCurve_{:02d}".format(i+1))
+                    projection_curve = circle_result[0]
+                    circle_shape = cmds.listRelatives(projection_curve, shapes=True)[0]
                 
-                projected_curve_groups = []
+                    # Store for cleanup
+                    self.projection_curves.append(projection_curve)
+                    self._created_nodes.add(projection_curve)
                 
-                # Project each curve individually with specific parameters
-                for i, curve in enumerate(self.projection_curves):
-                    # Use polyProjectCurve with proper settings
+                    # Connect PFX stroke shape directly
+                    cmds.connectAttr("{}.outMainCurves[0]".format(stroke_shape), 
+                                    "{}.create".format(circle_shape), force=True)
+                    
+                    # Project right away with polyProjectCurve and the projection settings
                     result = cmds.polyProjectCurve(
-                        curve, self.duplicated_geo,
+                        projection_curve, self.duplicated_geo,
                         constructionHistory=True,        # ch=1
                         pointsOnEdges=points_on_edges,   # pointsOnEdges (from UI)
                         curveSamples=curve_samples,      # curveSamples (from UI)
@@ -365,124 +425,109 @@ class DDFreeSplitTool:
                         tolerance=tolerance              # tolerance (from UI)
                     )
                     
-                    # Result is a list: [projectedCurve, curveVarGroup]
+                    # Result is a list: [curveVarGroup, polyProjectCurve history node]
                     if result:
-                        projected_curve_groups.append(result[1])  # Store curveVarGroup
+                        self._curve_var_groups.extend(cmds.ls(result, type="curveVarGroup"))  # Store curveVarGroup
                 
             except Exception as e:
                 cmds.warning("Projection failed: {}".format(str(e)))
+        
+        # Set the first curve as main reference (for backward compatibility)
+        if self.projection_curves:
+            self.projection_curve = self.projection_curves[0]
         else:
             cmds.warning("No valid projection curves created!")
             
     def execute_split(self, *args):
         """Execute the mesh split using MEL command with proper tool settings"""
-        curve_groups = cmds.ls(type="curveVarGroup")
+        curve_groups = self._existing_nodes(self._curve_var_groups) or cmds.ls(type="curveVarGroup")
         if not curve_groups:
             cmds.warning("No projected curve found!")
             return
             
-        # Get detachEdges setting from UI
-        detach_edges = True
-        try:
-            detach_edges = cmds.checkBox("detachEdges", query=True, value=True)
-        except:
-            pass  # Use default detachEdges=True
+        with viewport_suspended():
+            # Get detachEdges setting from UI (stored setting in batch mode)
+            detach_edges = self.detach_edges
+            if not self.batch_mode:
+                try:
+                    detach_edges = cmds.checkBox("detachEdges", query=True, value=True)
+                except:
+                    pass  # Use default detachEdges
         
-        try:
-            # Set the polySplit tool options BEFORE executing the command
-            # CORRECT METHOD: Use splitPolyWithCurveOperation optionVar
-            # 1 = Keep pieces together, 2 = Detach/separate pieces
-            operation_value = 2 if detach_edges else 1
-            cmds.optionVar(intValue=("splitPolyWithCurveOperation", operation_value))
+            try:
+                # Set the polySplit tool options BEFORE executing the command
+                # CORRECT METHOD: Use splitPolyWithCurveOperation optionVar
+                # 1 = Keep pieces together, 2 = Detach/separate pieces
+                operation_value = 2 if detach_edges else 1
+                cmds.optionVar(intValue=("splitPolyWithCurveOperation", operation_value))
             
-            # Select all projected curve groups first, then add target geometry
-            cmds.select(curve_groups, replace=True)
-            cmds.select(self.duplicated_geo, add=True)
+                # Select all projected curve groups first, then add target geometry
+                cmds.select(curve_groups, replace=True)
+                cmds.select(self.duplicated_geo, add=True)
             
-            # Execute split with all curve groups using the MEL command
-            # This will respect the tool settings we just configured
-            mel.eval("performSplitMeshWithProjectedCurve 0")
+                # Execute split with all curve groups using the MEL command
+                # This will respect the tool settings we just configured
+                mel.eval("performSplitMeshWithProjectedCurve 0")
             
-        except Exception as e:
-            cmds.warning("Split failed: {}".format(str(e)))
+            except Exception as e:
+                cmds.warning("Split failed: {}".format(str(e)))
             
     def finish_and_cleanup(self, *args):
-        """Finish and cleanup"""
-        self.restore_camera_state()
-        
-        # Handle projected curves option
-        keep_projected_curves = False
-        try:
-            keep_projected_curves = cmds.checkBox("keepHistory", query=True, value=True)
-        except:
-            pass
-            
-        # Find all created objects for cleanup
-        split_groups = [obj for obj in cmds.ls(transforms=True) if obj.endswith("_split")]
-        pfx_objects = cmds.ls(type="stroke")
-        
-        # Find Paint Effects stroke transforms (they follow pattern like strokeDefaultPaint1, strokeDefaultPaint2, etc.)
-        pfx_transforms = []
-        for pfx_shape in pfx_objects:
-            if cmds.objExists(pfx_shape):
-                pfx_parents = cmds.listRelatives(pfx_shape, parent=True)
-                if pfx_parents:
-                    pfx_transforms.extend(pfx_parents)
-        
-        # Handle multiple projection curves (new approach) or single curve (backward compatibility)
-        if hasattr(self, 'projection_curves') and self.projection_curves:
-            projection_curves = [curve for curve in self.projection_curves if cmds.objExists(curve)]
-        elif self.projection_curve and cmds.objExists(self.projection_curve):
-            projection_curves = [self.projection_curve]
-        else:
-            projection_curves = []
+        """Finish and cleanup - the whole cleanup is a single undo entry"""
+        with viewport_suspended():
+            self.restore_camera_state()
             
-        projection_curve_groups = cmds.ls(type="curveVarGroup")
-        
-        # ALWAYS delete construction history from duplicated geometry first
-        if self.duplicated_geo and cmds.objExists(self.duplicated_geo):
-            cmds.delete(self.duplicated_geo, constructionHistory=True)
-        
-        # ALWAYS delete all split groups
-        for split_group in split_groups:
-            if cmds.objExists(split_group):
-                cmds.delete(split_group)
-                
-        # ALWAYS delete Paint Effects strokes (both shapes and transforms)
-        for pfx_obj in pfx_objects:
-            if cmds.objExists(pfx_obj):
-                cmds.delete(pfx_obj)
-                
-        # ALWAYS delete Paint Effects transforms
-        for pfx_transform in pfx_transforms:
-            if cmds.objExists(pfx_transform):
-                cmds.delete(pfx_transform)
+            # Handle projected curves option
+            keep_projected_curves = self.keep_projected_curves
+            if not self.batch_mode:
+                try:
+                    keep_projected_curves = cmds.checkBox("keepHistory", query=True, value=True)
+                except:
+                    pass
                 
-        # ALWAYS delete the original projection curves (circles)
-        for proj_curve in projection_curves:
-            if cmds.objExists(proj_curve):
-                cmds.delete(proj_curve)
-        
-        # Handle projection curve groups based on keep_projected_curves setting
-        if keep_projected_curves:
-            # Keep projected curves visible - don't delete them
-            pass
-        else:
-            # Delete projection curve groups (polyProjectCurve results)
-            for curve_group in projection_curve_groups:
-                if cmds.objExists(curve_group):
-                    cmds.delete(curve_group)
-        
-        # Always cleanup temporary plane
-        if self.temp_plane and cmds.objExists(self.temp_plane):
-            cmds.delete(self.temp_plane)
+            # Paint Effects strokes drawn by the user - scanned, so strokes drawn after the last convert go too
+            pfx_objects = cmds.ls(type="stroke")
+            
+            # Find Paint Effects stroke transforms (they follow pattern like strokeDefaultPaint1, strokeDefaultPaint2, etc.)
+            pfx_transforms = []
+            if pfx_objects:
+                pfx_transforms = cmds.listRelatives(pfx_objects, parent=True) or []
+            
+            # Split geometry, temp plane, projection circles and Paint Effects strokes
+            to_delete = list(self._created_nodes) + pfx_objects + pfx_transforms
+            
+            # Keep projected curves visible unless the user asked to remove them
+            if not keep_projected_curves:
+                to_delete.extend(self._existing_nodes(self._curve_var_groups) or cmds.ls(type="curveVarGroup"))
+            
+            # ALWAYS delete construction history from duplicated geometry first
+            if self.duplicated_geo and cmds.objExists(self.duplicated_geo):
+                cmds.delete(self.duplicated_geo, constructionHistory=True)
+            
+            # Delete everything that is left in one call
+            to_delete = self._existing_nodes(to_delete)
+            if to_delete:
+                cmds.delete(to_delete)
+            self._created_nodes.clear()
+            self._curve_var_groups = []
             
         # DON'T unhide original geometry - leave it hidden
         # User comment: "az eredeti geót nem kell unhide-olni"
         
         # Close GUI
-        if self.gui_window and cmds.window(self.gui_window, exists=True):
+        if self._window_alive:
             cmds.deleteUI(self.gui_window)
+            self._window_alive = False
+        
+    def _existing_nodes(self, names):
+        """Resolve node names through a single MSelectionList, dropping ones that no longer exist"""
+        selection = om.MSelectionList()
+        for name in names:
+            try:
+                selection.add(name)
+            except RuntimeError:
+                pass  # Node was already deleted
+        return list(selection.getSelectionStrings())
         
     def cancel_operation(self, *args):
         """Cancel and restore"""
@@ -494,8 +539,9 @@ class DDFreeSplitTool:
             cmds.delete(self.temp_plane)
         if self.target_geo and cmds.objExists(self.target_geo):
             cmds.showHidden(self.target_geo)
-        if self.gui_window and cmds.window(self.gui_window, exists=True):
+        if self._window_alive:
             cmds.deleteUI(self.gui_window)
+            self._window_alive = False
         
     def restore_camera_state(self):
         """Restore camera state"""
@@ -514,9 +560,10 @@ class DDFreeSplitTool:
 
 
 def show_tool():
-    """Launch the tool"""
+    """Launch the tool - under mayapy/batch the UI is skipped and the tool is driven through its methods"""
     tool = DDFreeSplitTool()
-    tool.create_ui()
+    if not tool.batch_mode:
+        tool.create_ui()
     return tool
 
 